@@ -4,13 +4,23 @@ Custom Claude Code Statusline
 Shows token usage and conversation log file path using built-in Claude Code data
 """
 
-import json
 import sys
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # orjson is optional
 
-def format_tokens(tokens: int) -> str:
-    """Format token count with thousands separator."""
-    return f"{tokens:,}"
+
+STATUSLINE_TEMPLATE = (
+    "{status} Context: {total_context:,}/{token_limit:,} ({percentage}%)"
+    " | 📥 Input: {input_tokens:,}"
+    " | 📤 Output: {output_tokens:,}"
+    " | 🔨 Cache Write: {cache_creation:,}"
+    " | 💾 Cache Read: {cache_read:,}"
+    " | 📊 Session: {total_input:,}↓ {total_output:,}↑"
+    " | 📝 {transcript_path}"
+)
 
 
 def get_percentage(current: int, limit: int) -> int:
@@ -22,9 +32,14 @@ def get_percentage(current: int, limit: int) -> int:
 
 def main():
     """Main statusline script."""
+    raw = sys.stdin.buffer.read()
+    if not raw:
+        print("⚠️  No input data")
+        return
+
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        input_data = json_loads(raw)
+    except ValueError:
         print("⚠️  No input data")
         return
 
@@ -50,9 +65,6 @@ def main():
     token_limit = context_window.get("context_window_size", 200000)
     percentage = get_percentage(total_context, token_limit)
 
-    formatted_total = format_tokens(total_context)
-    formatted_limit = format_tokens(token_limit)
-
     if percentage >= 95:
         status = "🔴"
     elif percentage >= 80:
@@ -65,17 +77,19 @@ def main():
 
     transcript_path = input_data.get("transcript_path", "")
 
-    statusline_parts = [
-        f"{status} Context: {formatted_total}/{formatted_limit} ({percentage}%)",
-        f"📥 Input: {format_tokens(input_tokens)}",
-        f"📤 Output: {format_tokens(output_tokens)}",
-        f"🔨 Cache Write: {format_tokens(cache_creation)}",
-        f"💾 Cache Read: {format_tokens(cache_read)}",
-        f"📊 Session: {format_tokens(total_input)}↓ {format_tokens(total_output)}↑",
-        f"📝 {transcript_path}"
-    ]
-
-    print(" | ".join(statusline_parts))
+    print(STATUSLINE_TEMPLATE.format(
+        status=status,
+        total_context=total_context,
+        token_limit=token_limit,
+        percentage=percentage,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation=cache_creation,
+        cache_read=cache_read,
+        total_input=total_input,
+        total_output=total_output,
+        transcript_path=transcript_path,
+    ))
 
 
 if __name__ == "__main__":